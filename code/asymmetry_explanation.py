@@ -1,18 +1,20 @@
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # batch script: only saves to disk
 import matplotlib.pyplot as plt
 import os
 
 # Set up the box
 L = 1.0
-x = np.linspace(0, L, 1000)
+x = np.linspace(0, L, 1000, dtype=np.float32)  # plotting only, single precision is plenty
 
 # Define the two wavefunctions
-psi_1 = np.sqrt(2) * np.sin(1 * np.pi * x / L)  # n=1
-psi_2 = np.sqrt(2) * np.sin(2 * np.pi * x / L)  # n=2
+psi_1 = np.sqrt(np.float32(2)) * np.sin(1 * np.pi * x / L)  # n=1
+psi_2 = np.sqrt(np.float32(2)) * np.sin(2 * np.pi * x / L)  # n=2
 
 # Superposition 
-psi_super = (psi_1 + psi_2) / np.sqrt(2)
+psi_super = (psi_1 + psi_2) / np.sqrt(np.float32(2))
 
 # Probability densities
 prob_1 = psi_1**2
@@ -110,6 +112,6 @@ plt.tight_layout()
 output_dir = './qm_plots_simple'
 os.makedirs(output_dir, exist_ok=True)
 filename = os.path.join(output_dir, 'superposition_explanation.png')
-plt.savefig(filename, dpi=150, bbox_inches='tight')
+plt.savefig(filename, dpi=150)
 print(f"✓ Detailed explanation saved: {filename}")
 plt.close()
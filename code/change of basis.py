@@ -9,19 +9,42 @@ The particle is confined in a 1D box of length L with infinite potential walls a
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # batch script: only saves to disk
 import matplotlib.pyplot as plt
+from matplotlib.font_manager import FontProperties
 import os
 
 class ParticleInBox:
     
-    def __init__(self, L=1.0, n_max=10, n_points=1000):
+    def __init__(self, L=1.0, n_max=10, n_points=1000, dtype=np.float64):
         
         self.L = L
         self.n_max = n_max
-        self.x = np.linspace(0, L, n_points)
+        self.x = np.linspace(0, L, n_points, dtype=dtype)
         self.dx = self.x[1] - self.x[0]
         
-    def position_wavefunction(self, n, x):
+        # Basis matrix B[n, i] = ψ_n(x_i), built once and reused by both transforms
+        # Filled in place, so only one (n_max, n_points) array is ever allocated
+        n_quantum = np.arange(1, n_max + 1, dtype=dtype)
+        self.B = np.empty((n_max, n_points), dtype=dtype)
+        np.multiply.outer(n_quantum * np.pi / L, self.x, out=self.B)
+        np.sin(self.B, out=self.B)
+        self.B *= np.sqrt(2.0 / L)
+        # Rows are handed out as views, so callers must not be able to modify them
+        self.B.flags.writeable = False
+        
+        # Trapezoidal weights (dx/2, dx, ..., dx, dx/2)
+        self.w = np.full(n_points, self.dx, dtype=dtype)
+        self.w[0] = self.w[-1] = self.dx / 2
+        
+    def position_wavefunction(self, n, x=None):
+        
+        # On the box grid, reuse the (read-only) row already stored in the basis matrix
+        if x is None and n < self.n_max:
+            return self.B[n]
+        if x is None:
+            x = self.x
         
         n_quantum = n + 1
         
@@ -32,25 +55,28 @@ class ParticleInBox:
     
     def energy_to_position(self, coefficients):
        
-        coefficients = np.array(coefficients)
+        coefficients = np.asarray(coefficients)
         n_states = len(coefficients)
         
-        psi_x = np.zeros_like(self.x, dtype=complex)
-        
-        for n in range(n_states):
-            psi_x += coefficients[n] * self.position_wavefunction(n, self.x)
+        # The basis is real: only complex coefficients need a complex result,
+        # real ones are evaluated at the precision of the grid
+        if not np.iscomplexobj(coefficients):
+            coefficients = coefficients.astype(self.B.dtype, copy=False)
         
+        # ψ(x) = Σ c_n ψ_n(x)
+        psi_x = coefficients[:self.n_max] @ self.B[:n_states]
+
+        # States above n_max are not in the cached basis, evaluate them directly
+        for n in range(self.n_max, n_states):
+            psi_x += coefficients[n] * self.position_wavefunction(n)
+
         return psi_x
     
     def position_to_energy(self, psi_x):
        
-        coefficients = np.zeros(self.n_max, dtype=complex)
-        
-        for n in range(self.n_max):
-            psi_n = self.position_wavefunction(n, self.x)
-            # Inner product: c_n = ⟨n|ψ⟩ = ∫ ψ_n*(x) ψ(x) dx
-            # Use trapezoidal rule for numerical integration
-            coefficients[n] = np.trapz(psi_n * psi_x, self.x)
+        # Inner product: c_n = ⟨n|ψ⟩ = ∫ ψ_n*(x) ψ(x) dx
+        # Trapezoidal rule folded into the weights, so all c_n come from one matrix-vector product
+        coefficients = self.B @ (psi_x * self.w)
         
         return coefficients
 
@@ -96,7 +122,7 @@ def example_ground_state(output_dir='./'):
     
     plt.tight_layout()
     filename = os.path.join(output_dir, 'ground_state_simple.png')
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.savefig(filename, dpi=150)
     print(f"✓ Plot saved: {filename}\n")
     plt.close()
 
@@ -107,7 +133,7 @@ def example_superposition(output_dir='./'):
     print("Example 2: Superposition (|n=1⟩ + |n=2⟩)/√2")
     print("=" * 60)
     
-    pib = ParticleInBox(L=1.0, n_max=5)
+    pib = ParticleInBox(L=1.0, n_max=5, dtype=np.float32)  # plotting only
     
     # Superposition of first two states
     c_n = np.array([1.0, 1.0, 0, 0, 0]) / np.sqrt(2)
@@ -136,7 +162,7 @@ def example_superposition(output_dir='./'):
     
     plt.tight_layout()
     filename = os.path.join(output_dir, 'superposition_simple.png')
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.savefig(filename, dpi=150)
     print(f"✓ Plot saved: {filename}\n")
     plt.close()
 
@@ -158,8 +184,8 @@ def example_localized_packet(output_dir='./'):
     psi_x_gaussian[pib.x <= 0] = 0
     psi_x_gaussian[pib.x >= pib.L] = 0
     
-    # Normalize
-    norm = np.sqrt(np.trapz(np.abs(psi_x_gaussian)**2, pib.x))
+    # Normalize (trapezoidal rule as a dot product with the precomputed weights)
+    norm = np.sqrt(np.dot(np.abs(psi_x_gaussian)**2, pib.w))
     psi_x_gaussian /= norm
     
     # Transform to energy basis
@@ -213,7 +239,7 @@ def example_localized_packet(output_dir='./'):
     
     plt.tight_layout()
     filename = os.path.join(output_dir, 'localized_packet_simple.png')
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.savefig(filename, dpi=150)
     print(f"✓ Plot saved: {filename}\n")
     plt.close()
 
@@ -224,7 +250,7 @@ def show_individual_states(output_dir='./'):
     print("Example 4: Individual Energy Eigenstates")
     print("=" * 60)
     
-    pib = ParticleInBox(L=1.0, n_max=5)
+    pib = ParticleInBox(L=1.0, n_max=5, dtype=np.float32)  # plotting only
     
     fig, axes = plt.subplots(2, 3, figsize=(14, 8))
     axes = axes.flatten()
@@ -253,7 +279,7 @@ def show_individual_states(output_dir='./'):
     
     plt.tight_layout()
     filename = os.path.join(output_dir, 'individual_states_simple.png')
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.savefig(filename, dpi=150)
     print(f"✓ Plot saved: {filename}\n")
     plt.close()
 
@@ -266,14 +292,8 @@ def demonstrate_orthonormality(output_dir='./'):
     
     pib = ParticleInBox(L=1.0, n_max=5)
     
-    # Compute overlap matrix
-    overlap = np.zeros((5, 5))
-    
-    for m in range(5):
-        psi_m = pib.position_wavefunction(m, pib.x)
-        for n in range(5):
-            psi_n = pib.position_wavefunction(n, pib.x)
-            overlap[m, n] = np.trapz(psi_m * psi_n, pib.x)
+    # Compute overlap matrix ⟨m|n⟩ = Σ_i w_i ψ_m(x_i) ψ_n(x_i), i.e. B diag(w) Bᵀ
+    overlap = (pib.B * pib.w) @ pib.B.T
     
     print("Overlap matrix ⟨m|n⟩:")
     print(np.round(overlap, 4))
@@ -292,16 +312,17 @@ def demonstrate_orthonormality(output_dir='./'):
     ax.set_xticklabels(range(1, 6))
     ax.set_yticklabels(range(1, 6))
     
-    # Add text annotations
+    # Add text annotations (one shared FontProperties, so font lookup happens once)
+    font = FontProperties(size=10)
     for i in range(5):
         for j in range(5):
-            text = ax.text(j, i, f'{overlap[i, j]:.2f}',
-                          ha="center", va="center", color="black", fontsize=10)
+            ax.text(j, i, f'{overlap[i, j]:.2f}',
+                    ha="center", va="center", color="black", fontproperties=font)
     
     plt.colorbar(im, ax=ax)
     plt.tight_layout()
     filename = os.path.join(output_dir, 'orthonormality_simple.png')
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.savefig(filename, dpi=150)
     print(f"✓ Plot saved: {filename}\n")
     plt.close()
 
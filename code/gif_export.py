@@ -0,0 +1,26 @@
+"""
+Shared GIF export for the superposition animations.
+
+Every frame is quantized against one palette so the colours stay stable from frame to frame.
+"""
+
+from PIL import Image
+
+
+def save_gif(frames, filename, duration):
+    """Write RGB frames to filename as a looping GIF, duration ms per frame."""
+    # The last frame shows every artist, so its palette covers all the colours
+    palette = frames[-1].convert('P', palette=Image.Palette.ADAPTIVE, colors=128)
+    frames = [frame.quantize(palette=palette, dither=Image.Dither.NONE) for frame in frames]
+
+    # The adaptive palette averages the white background with nearby antialiasing
+    # shades, so snap the entry that white was mapped to back to pure white
+    white = Image.new('RGB', (1, 1), 'white').quantize(palette=palette, dither=Image.Dither.NONE)
+    index = white.getpixel((0, 0))
+    colours = palette.getpalette()
+    colours[3 * index:3 * index + 3] = [255, 255, 255]
+    for frame in frames:
+        frame.putpalette(colours)
+
+    frames[0].save(filename, save_all=True, append_images=frames[1:],
+                   duration=duration, loop=0, optimize=True)
@@ -1,166 +1,216 @@
 
 
 import numpy as np
+import numexpr as ne
+import matplotlib
+matplotlib.use('Agg')  # batch script: only saves to disk
 import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation, AbstractMovieWriter
 from PIL import Image
+from io import BytesIO
+from gif_export import save_gif
 import os
-import glob
 
 # Set up the box
 L = 1.0
-x = np.linspace(0, L, 1000)
+x = np.linspace(0, L, 1000, dtype=np.float32)  # plotting only, single precision is plenty
 
 # Define the two wavefunctions
-psi_1 = np.sqrt(2) * np.sin(1 * np.pi * x / L)  # n=1
-psi_2 = np.sqrt(2) * np.sin(2 * np.pi * x / L)  # n=2
-
-# Create output directory
-output_dir = './qm_animation_frames'
-os.makedirs(output_dir, exist_ok=True)
+psi_1 = np.sqrt(np.float32(2)) * np.sin(1 * np.pi * x / L)  # n=1
+psi_2 = np.sqrt(np.float32(2)) * np.sin(2 * np.pi * x / L)  # n=2
 
 n_frames = 30
-alphas = np.linspace(0, 1, n_frames)
+alphas = np.linspace(0, 1, n_frames, dtype=np.float32)
 
-for i, alpha in enumerate(alphas):
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig.suptitle(f'Quantum Interference: Building the Superposition (Frame {i+1}/{n_frames})', 
-                 fontsize=16, fontweight='bold')
-    
-    ax1, ax2, ax3, ax4 = axes.flatten()
+# Frame-invariant layout: build the figure and artists once, update data per frame
+fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+title = fig.suptitle('', fontsize=16, fontweight='bold')
+
+ax1, ax2, ax3, ax4 = axes.flatten()
+
+
+ax1.plot(x, psi_1, 'b-', linewidth=2.5, label='ψ₁ (n=1)', alpha=0.8)
+line_psi_2, = ax1.plot(x, psi_2 * 0, 'r-', linewidth=2.5, label='ψ₂ (n=2) × 0.00', alpha=0.8)
+ax1.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
+ax1.fill_between(x, 0, psi_1, alpha=0.2, color='blue')
+ax1.set_ylabel('Wavefunction', fontsize=12)
+ax1.set_title('Individual States', fontsize=13, fontweight='bold')
+legend_1 = ax1.legend(loc='upper right', fontsize=11)
+ax1.grid(True, alpha=0.3)
+ax1.set_xlim([0, 1])
+ax1.set_ylim([-2, 2])
+
+
+ax2.plot(x, psi_1, 'b--', linewidth=1, alpha=0.3, label='ψ₁')
+line_psi_2_dashed, = ax2.plot(x, psi_2 * 0, 'r--', linewidth=1, alpha=0.3, label='ψ₂')
+line_super, = ax2.plot(x, psi_1, 'purple', linewidth=3.5, label='|n=1⟩ only')
+ax2.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
+ax2.set_ylabel('Wavefunction', fontsize=12)
+ax2.set_title('Superposition ψ₁ + ψ₂', fontsize=13, fontweight='bold')
+legend_2 = ax2.legend(loc='upper right', fontsize=11)
+ax2.grid(True, alpha=0.3)
+ax2.set_xlim([0, 1])
+ax2.set_ylim([-2.5, 2.5])
+
+interference_notes = [
+    ax2.annotate('Constructive\nInterference', xy=(0.25, 1.7), fontsize=11,
+                bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.9),
+                ha='center'),
+    ax2.annotate('Destructive\nInterference', xy=(0.75, -0.3), fontsize=11,
+                bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.9),
+                ha='center'),
+]
+
+
+line_prob, = ax3.plot(x, psi_1**2, 'purple', linewidth=3.5)
+ax3.set_ylabel('Probability |ψ(x)|²', fontsize=12)
+ax3.set_xlabel('Position x', fontsize=12)
+ax3.set_title('Where Will We Find The Particle?', fontsize=13, fontweight='bold')
+ax3.grid(True, alpha=0.3)
+ax3.set_xlim([0, 1])
+ax3.set_ylim([0, 3.5])
+
+# Peak markers, shown once the superposition is nearly complete
+left_marker, = ax3.plot([], [], 'go', markersize=15, label='Left', zorder=5)
+right_marker, = ax3.plot([], [], 'ro', markersize=15, label='Right', zorder=5)
+legend_3 = ax3.legend(loc='upper right', fontsize=11)
+
+
+idx_025 = 250
+idx_075 = 750
+
+x_pos = np.arange(3)
+width = 0.35
+
+bars_025 = ax4.bar(x_pos - width/2, np.zeros(3), width, 
+                   label='At x=0.25 (left)', color=['blue', 'red', 'purple'], alpha=0.7)
+bars_075 = ax4.bar(x_pos + width/2, np.zeros(3), width, 
+                   label='At x=0.75 (right)', color=['blue', 'red', 'purple'], alpha=0.4)
+
+ax4.axhline(y=0, color='k', linestyle='-', linewidth=1)
+ax4.set_ylabel('Wavefunction Value', fontsize=12)
+ax4.set_xlabel('Component', fontsize=12)
+ax4.set_title('Comparing Left vs Right', fontsize=13, fontweight='bold')
+ax4.set_xticks(x_pos)
+ax4.set_xticklabels(['ψ₁', 'ψ₂', 'Sum'])
+ax4.legend(fontsize=11)
+ax4.grid(True, alpha=0.3, axis='y')
+ax4.set_ylim([-1.6, 2])
+
+comparison_notes = [
+    ax4.text(2, 1.5, 'LEFT:\nBoth +\n→ ADD', ha='center', fontsize=10, 
+            bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8)),
+    ax4.text(2, -1.2, 'RIGHT:\nOpposite\n→ CANCEL', ha='center', fontsize=10,
+            bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8)),
+]
+
+plt.tight_layout(rect=[0, 0, 1, 0.96])
+
+# Filled regions that depend on alpha are swapped out each frame;
+# the sign masks of ψ₂ do not depend on alpha
+fills = []
+pos_mask = psi_2 > 0
+neg_mask = psi_2 < 0
+
+# Per-frame results are written into preallocated buffers
+psi_2_scaled = np.empty_like(psi_2)
+psi_super = np.empty_like(psi_1)
+prob_super = np.empty_like(psi_1)
+
+def update(i):
+    alpha = alphas[i]
+    title.set_text(f'Quantum Interference: Building the Superposition (Frame {i+1}/{n_frames})')
     
    
     if alpha < 0.01:
-        psi_super = psi_1.copy()
+        np.copyto(psi_super, psi_1)
         label_text = "|n=1⟩ only"
         progress = 0
     else:
         weight_1 = 1.0 / np.sqrt(1 + alpha**2)
         weight_2 = alpha / np.sqrt(1 + alpha**2)
-        psi_super = weight_1 * psi_1 + weight_2 * psi_2
+        ne.evaluate("weight_1 * psi_1 + weight_2 * psi_2", out=psi_super)
         progress = int(alpha * 100)
         if alpha < 0.99:
             label_text = f"Adding |n=2⟩... {progress}%"
         else:
             label_text = "(|n=1⟩ + |n=2⟩)/√2 "
     
+    ne.evaluate("psi_super * psi_super", out=prob_super)
+    np.multiply(psi_2, alpha, out=psi_2_scaled)
     
-    ax1.plot(x, psi_1, 'b-', linewidth=2.5, label='ψ₁ (n=1)', alpha=0.8)
-    ax1.plot(x, psi_2 * alpha, 'r-', linewidth=2.5, label=f'ψ₂ (n=2) × {alpha:.2f}', alpha=0.8)
-    ax1.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
-    ax1.fill_between(x, 0, psi_1, alpha=0.2, color='blue')
-    ax1.fill_between(x, 0, psi_2 * alpha, where=(psi_2>0), alpha=0.2, color='red', interpolate=True)
-    ax1.fill_between(x, 0, psi_2 * alpha, where=(psi_2<0), alpha=0.2, color='orange', interpolate=True)
-    ax1.set_ylabel('Wavefunction', fontsize=12)
-    ax1.set_title('Individual States', fontsize=13, fontweight='bold')
-    ax1.legend(loc='upper right', fontsize=11)
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim([0, 1])
-    ax1.set_ylim([-2, 2])
-    
-   
-    ax2.plot(x, psi_1, 'b--', linewidth=1, alpha=0.3, label='ψ₁')
-    ax2.plot(x, psi_2 * alpha, 'r--', linewidth=1, alpha=0.3, label='ψ₂')
-    ax2.plot(x, psi_super, 'purple', linewidth=3.5, label=label_text)
-    ax2.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
-    ax2.fill_between(x, 0, psi_super, alpha=0.4, color='purple')
-    ax2.set_ylabel('Wavefunction', fontsize=12)
-    ax2.set_title('Superposition ψ₁ + ψ₂', fontsize=13, fontweight='bold')
-    ax2.legend(loc='upper right', fontsize=11)
-    ax2.grid(True, alpha=0.3)
-    ax2.set_xlim([0, 1])
-    ax2.set_ylim([-2.5, 2.5])
+    for fill in fills:
+        fill.remove()
+    fills[:] = [
+        ax1.fill_between(x, 0, psi_2_scaled, where=pos_mask, alpha=0.2, color='red', interpolate=True),
+        ax1.fill_between(x, 0, psi_2_scaled, where=neg_mask, alpha=0.2, color='orange', interpolate=True),
+        ax2.fill_between(x, 0, psi_super, alpha=0.4, color='purple'),
+        ax3.fill_between(x, 0, prob_super, alpha=0.5, color='purple'),
+    ]
     
     
-    if alpha > 0.8:
-        ax2.annotate('Constructive\nInterference', xy=(0.25, 1.7), fontsize=11,
-                    bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.9),
-                    ha='center')
-        ax2.annotate('Destructive\nInterference', xy=(0.75, -0.3), fontsize=11,
-                    bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.9),
-                    ha='center')
+    line_psi_2.set_ydata(psi_2_scaled)
+    legend_1.get_texts()[1].set_text(f'ψ₂ (n=2) × {alpha:.2f}')
     
+    line_psi_2_dashed.set_ydata(psi_2_scaled)
+    line_super.set_ydata(psi_super)
+    legend_2.get_texts()[2].set_text(label_text)
     
-    prob_super = psi_super**2
-    ax3.plot(x, prob_super, 'purple', linewidth=3.5)
-    ax3.fill_between(x, 0, prob_super, alpha=0.5, color='purple')
-    ax3.set_ylabel('Probability |ψ(x)|²', fontsize=12)
-    ax3.set_xlabel('Position x', fontsize=12)
-    ax3.set_title('Where Will We Find The Particle?', fontsize=13, fontweight='bold')
-    ax3.grid(True, alpha=0.3)
-    ax3.set_xlim([0, 1])
-    ax3.set_ylim([0, 3.5])
+    line_prob.set_ydata(prob_super)
     
     # Mark peaks
-    if alpha > 0.8:
+    show_notes = alpha > 0.8
+    if show_notes:
         left_peak_idx = np.argmax(prob_super[:500])
         right_peak_idx = 500 + np.argmax(prob_super[500:])
-        ax3.plot(x[left_peak_idx], prob_super[left_peak_idx], 'go', 
-                markersize=15, label=f'Left: {prob_super[left_peak_idx]:.2f}', zorder=5)
-        ax3.plot(x[right_peak_idx], prob_super[right_peak_idx], 'ro', 
-                markersize=15, label=f'Right: {prob_super[right_peak_idx]:.2f}', zorder=5)
-        ax3.legend(loc='upper right', fontsize=11)
+        left_marker.set_data([x[left_peak_idx]], [prob_super[left_peak_idx]])
+        right_marker.set_data([x[right_peak_idx]], [prob_super[right_peak_idx]])
+        legend_3.get_texts()[0].set_text(f'Left: {prob_super[left_peak_idx]:.2f}')
+        legend_3.get_texts()[1].set_text(f'Right: {prob_super[right_peak_idx]:.2f}')
+    left_marker.set_visible(show_notes)
+    right_marker.set_visible(show_notes)
+    legend_3.set_visible(show_notes)
     
    
-    idx_025 = 250
-    idx_075 = 750
-    
-    values_at_025 = [psi_1[idx_025], psi_2[idx_025] * alpha, psi_super[idx_025]]
-    values_at_075 = [psi_1[idx_075], psi_2[idx_075] * alpha, psi_super[idx_075]]
-    
-    x_pos = np.arange(3)
-    width = 0.35
-    
-    ax4.bar(x_pos - width/2, values_at_025, width, 
-            label='At x=0.25 (left)', color=['blue', 'red', 'purple'], alpha=0.7)
-    ax4.bar(x_pos + width/2, values_at_075, width, 
-            label='At x=0.75 (right)', color=['blue', 'red', 'purple'], alpha=0.4)
-    
-    ax4.axhline(y=0, color='k', linestyle='-', linewidth=1)
-    ax4.set_ylabel('Wavefunction Value', fontsize=12)
-    ax4.set_xlabel('Component', fontsize=12)
-    ax4.set_title('Comparing Left vs Right', fontsize=13, fontweight='bold')
-    ax4.set_xticks(x_pos)
-    ax4.set_xticklabels(['ψ₁', 'ψ₂', 'Sum'])
-    ax4.legend(fontsize=11)
-    ax4.grid(True, alpha=0.3, axis='y')
-    ax4.set_ylim([-1.6, 2])
+    values_at_025 = [psi_1[idx_025], psi_2_scaled[idx_025], psi_super[idx_025]]
+    values_at_075 = [psi_1[idx_075], psi_2_scaled[idx_075], psi_super[idx_075]]
     
-    if alpha > 0.8:
-        ax4.text(2, 1.5, 'LEFT:\nBoth +\n→ ADD', ha='center', fontsize=10, 
-                bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
-        ax4.text(2, -1.2, 'RIGHT:\nOpposite\n→ CANCEL', ha='center', fontsize=10,
-                bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8))
+    for bar, value in zip(bars_025, values_at_025):
+        bar.set_height(value)
+    for bar, value in zip(bars_075, values_at_075):
+        bar.set_height(value)
     
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
-    
-    # Save frame
-    filename = os.path.join(output_dir, f'frame_{i:03d}.png')
-    plt.savefig(filename, dpi=100, bbox_inches='tight')
-    plt.close()
+    for note in interference_notes + comparison_notes:
+        note.set_visible(show_notes)
     
     if (i+1) % 5 == 0:
         print(f"  ✓ Frame {i+1}/{n_frames} complete ({progress}%)")
 
-print(f"\n✓ All {n_frames} frames created!")
-
-
-frame_files = sorted(glob.glob(os.path.join(output_dir, 'frame_*.png')))
-print(f"Found {len(frame_files)} frames")
 
+class SharedPaletteWriter(AbstractMovieWriter):
+    """GIF writer that quantizes every frame against one shared palette."""
+    
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        self.frames = []
+    
+    def grab_frame(self, **savefig_kwargs):
+        buf = BytesIO()
+        self.fig.savefig(buf, **{**savefig_kwargs, 'format': 'rgba', 'dpi': self.dpi})
+        self.frames.append(
+            Image.frombuffer('RGBA', self.frame_size, buf.getbuffer(), 'raw', 'RGBA', 0, 1).convert('RGB'))
+    
+    def finish(self):
+        save_gif(self.frames, self.outfile, duration=int(1000 / self.fps))
 
-images = []
-for f in frame_files:
-    img = Image.open(f)
-    images.append(img)
 
+# Frames are rendered in memory and handed straight to the GIF writer
 output_gif = './quantum_interference.gif'
-images[0].save(
-    output_gif,
-    save_all=True,
-    append_images=images[1:],
-    duration=100,  
-    loop=0  
-)
+anim = FuncAnimation(fig, update, frames=n_frames)
+anim.save(output_gif, writer=SharedPaletteWriter(fps=10), dpi=100)
+plt.close(fig)
+
+print(f"\n✓ All {n_frames} frames created!")
 
 file_size_mb = os.path.getsize(output_gif) / 1024 / 1024
-print(f"\n✓ Animation saved as {output_gif} ({file_size_mb:.2f} MB)")
\ No newline at end of file
+print(f"\n✓ Animation saved as {output_gif} ({file_size_mb:.2f} MB)")
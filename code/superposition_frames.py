@@ -1,137 +1,240 @@
 
 import numpy as np
-import matplotlib.pyplot as plt
+# Figures are drawn straight onto an Agg canvas, bypassing pyplot's GUI
+# backends and global figure registry
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+from tqdm import tqdm
+from gif_export import save_gif
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 L = 1.0
-x = np.linspace(0, L, 1000)
+x = np.linspace(0, L, 1000, dtype=np.float32)  # plotting only, single precision is plenty
 
-psi_1 = np.sqrt(2) * np.sin(1 * np.pi * x / L)  
-psi_2 = np.sqrt(2) * np.sin(2 * np.pi * x / L)  
+psi_1 = np.sqrt(np.float32(2)) * np.sin(1 * np.pi * x / L)
+psi_2 = np.sqrt(np.float32(2)) * np.sin(2 * np.pi * x / L)
 
-output_dir = './qm_animation_frames'
-os.makedirs(output_dir, exist_ok=True)
+# The sign of ψ₂ does not depend on alpha
+mask_pos = psi_2 > 0
+mask_neg = psi_2 < 0
 
-print("Creating animation frames...")
-print("="*60)
+# Wavefunction values at the two comparison points x=0.25 and x=0.75
+idx_025, idx_075 = np.searchsorted(x, [0.25, 0.75])
+psi_1_025, psi_2_025 = float(psi_1[idx_025]), float(psi_2[idx_025])
+psi_1_075, psi_2_075 = float(psi_1[idx_075]), float(psi_2[idx_075])
+
+# The peak search splits the grid into left and right halves
+half = x.size // 2
+
+output_gif = './quantum_interference_animation.gif'
+
+# Resolution of the rendered frames; raise DPI to re-render at publication quality
+FIGSIZE = (10, 7)
+DPI = 72
 
 n_frames = 30
-alphas = np.linspace(0, 1, n_frames)
-
-for i, alpha in enumerate(alphas):
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig.suptitle(f'Quantum Interference: Building the Superposition (Frame {i+1}/{n_frames})', 
-                 fontsize=16, fontweight='bold')
-    
-    ax1, ax2, ax3, ax4 = axes.flatten()
-    
-    if alpha < 0.01:
-        psi_super = psi_1.copy()
-        label_text = "|n=1⟩ only"
-        progress = 0
-    else:
-        weight_1 = 1.0 / np.sqrt(1 + alpha**2)
-        weight_2 = alpha / np.sqrt(1 + alpha**2)
-        psi_super = weight_1 * psi_1 + weight_2 * psi_2
-        progress = int(alpha * 100)
-        if alpha < 0.99:
-            label_text = f"Adding |n=2⟩... {progress}%"
+alphas = np.linspace(0, 1, n_frames, dtype=np.float32)
+
+
+class FrameFigure:
+    """The 2x2 animation figure, built once and updated in place for each frame."""
+
+    def __init__(self):
+
+        self.fig = Figure(figsize=FIGSIZE, dpi=DPI)
+        FigureCanvasAgg(self.fig)
+        axes = self.fig.subplots(2, 2)
+        self.title = self.fig.suptitle('', fontsize=16, fontweight='bold')
+
+        self.ax1, self.ax2, self.ax3, self.ax4 = ax1, ax2, ax3, ax4 = axes.flatten()
+
+
+        ax1.plot(x, psi_1, 'b-', linewidth=2.5, label='ψ₁ (n=1)', alpha=0.8)
+        self.line_psi_2, = ax1.plot(x, psi_2 * 0, 'r-', linewidth=2.5, label='ψ₂ (n=2) × 0.00', alpha=0.8)
+        ax1.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
+        ax1.fill_between(x, 0, psi_1, alpha=0.2, color='blue')
+        ax1.set_ylabel('Wavefunction', fontsize=12)
+        ax1.set_title('Individual States', fontsize=13, fontweight='bold')
+        self.legend_1 = ax1.legend(loc='upper right', fontsize=11)
+        ax1.grid(True, alpha=0.3)
+        ax1.set_xlim([0, 1])
+        ax1.set_ylim([-2, 2])
+
+
+        ax2.plot(x, psi_1, 'b--', linewidth=1, alpha=0.3, label='ψ₁')
+        self.line_psi_2_dashed, = ax2.plot(x, psi_2 * 0, 'r--', linewidth=1, alpha=0.3, label='ψ₂')
+        self.line_super, = ax2.plot(x, psi_1, 'purple', linewidth=3.5, label='|n=1⟩ only')
+        ax2.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
+        ax2.set_ylabel('Wavefunction', fontsize=12)
+        ax2.set_title('Superposition ψ₁ + ψ₂', fontsize=13, fontweight='bold')
+        self.legend_2 = ax2.legend(loc='upper right', fontsize=11)
+        ax2.grid(True, alpha=0.3)
+        ax2.set_xlim([0, 1])
+        ax2.set_ylim([-2.5, 2.5])
+
+        self.interference_notes = [
+            ax2.annotate('Constructive\nInterference', xy=(0.25, 1.7), fontsize=11,
+                        bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.9),
+                        ha='center'),
+            ax2.annotate('Destructive\nInterference', xy=(0.75, -0.3), fontsize=11,
+                        bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.9),
+                        ha='center'),
+        ]
+
+
+        self.line_prob, = ax3.plot(x, psi_1**2, 'purple', linewidth=3.5)
+        ax3.set_ylabel('Probability |ψ(x)|²', fontsize=12)
+        ax3.set_xlabel('Position x', fontsize=12)
+        ax3.set_title('Where Will We Find The Particle?', fontsize=13, fontweight='bold')
+        ax3.grid(True, alpha=0.3)
+        ax3.set_xlim([0, 1])
+        ax3.set_ylim([0, 3.5])
+
+        # Peak markers, shown once the superposition is nearly complete
+        self.left_marker, = ax3.plot([], [], 'go', markersize=15, label='Left', zorder=5)
+        self.right_marker, = ax3.plot([], [], 'ro', markersize=15, label='Right', zorder=5)
+        self.legend_3 = ax3.legend(loc='upper right', fontsize=11)
+
+        x_pos = np.arange(3)
+        width = 0.35
+
+        # Bars start flat and only have their heights updated per frame
+        self.bars1 = ax4.bar(x_pos - width/2, np.zeros(3), width,
+                             label='At x=0.25 (left)', color=['blue', 'red', 'purple'], alpha=0.7)
+        self.bars2 = ax4.bar(x_pos + width/2, np.zeros(3), width,
+                             label='At x=0.75 (right)', color=['blue', 'red', 'purple'], alpha=0.4)
+
+        ax4.axhline(y=0, color='k', linestyle='-', linewidth=1)
+        ax4.set_ylabel('Wavefunction Value', fontsize=12)
+        ax4.set_xlabel('Component', fontsize=12)
+        ax4.set_title('Comparing Left vs Right', fontsize=13, fontweight='bold')
+        ax4.set_xticks(x_pos)
+        ax4.set_xticklabels(['ψ₁', 'ψ₂', 'Sum'])
+        ax4.legend(fontsize=11)
+        ax4.grid(True, alpha=0.3, axis='y')
+        ax4.set_ylim([-1.6, 2])
+
+        self.comparison_notes = [
+            ax4.text(2, 1.5, 'LEFT:\nBoth +\n→ ADD', ha='center', fontsize=10,
+                    bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8)),
+            ax4.text(2, -1.2, 'RIGHT:\nOpposite\n→ CANCEL', ha='center', fontsize=10,
+                    bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8)),
+        ]
+
+        # Subplot geometry is the same for every frame, so it is fitted only once
+        self.fig.tight_layout(rect=[0, 0, 1, 0.96])
+
+        # Filled regions that depend on alpha are swapped out each frame
+        self.fills = []
+
+        # Scratch buffers for the per-frame superposition and its density
+        self.psi_2_scaled = np.empty_like(x)
+        self.psi_super = np.empty_like(x)
+        self.prob_super = np.empty_like(x)
+        self.scratch = np.empty_like(x)
+
+    def render(self, i, alpha):
+
+        ax1, ax2, ax3, ax4 = self.ax1, self.ax2, self.ax3, self.ax4
+
+        self.title.set_text(f'Quantum Interference: Building the Superposition (Frame {i+1}/{n_frames})')
+
+        psi_super = self.psi_super
+        if alpha < 0.01:
+            np.copyto(psi_super, psi_1)
+            weight_1, weight_2 = 1.0, 0.0
+            label_text = "|n=1⟩ only"
+            progress = 0
         else:
-            label_text = "(|n=1⟩ + |n=2⟩)/√2 ✓"
-    
-    
-    ax1.plot(x, psi_1, 'b-', linewidth=2.5, label='ψ₁ (n=1)', alpha=0.8)
-    ax1.plot(x, psi_2 * alpha, 'r-', linewidth=2.5, label=f'ψ₂ (n=2) × {alpha:.2f}', alpha=0.8)
-    ax1.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
-    ax1.fill_between(x, 0, psi_1, alpha=0.2, color='blue')
-    ax1.fill_between(x, 0, psi_2 * alpha, where=(psi_2>0), alpha=0.2, color='red', interpolate=True)
-    ax1.fill_between(x, 0, psi_2 * alpha, where=(psi_2<0), alpha=0.2, color='orange', interpolate=True)
-    ax1.set_ylabel('Wavefunction', fontsize=12)
-    ax1.set_title('Individual States', fontsize=13, fontweight='bold')
-    ax1.legend(loc='upper right', fontsize=11)
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim([0, 1])
-    ax1.set_ylim([-2, 2])
-    
-    
-    ax2.plot(x, psi_1, 'b--', linewidth=1, alpha=0.3, label='ψ₁')
-    ax2.plot(x, psi_2 * alpha, 'r--', linewidth=1, alpha=0.3, label='ψ₂')
-    ax2.plot(x, psi_super, 'purple', linewidth=3.5, label=label_text)
-    ax2.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
-    ax2.fill_between(x, 0, psi_super, alpha=0.4, color='purple')
-    ax2.set_ylabel('Wavefunction', fontsize=12)
-    ax2.set_title('Superposition ψ₁ + ψ₂', fontsize=13, fontweight='bold')
-    ax2.legend(loc='upper right', fontsize=11)
-    ax2.grid(True, alpha=0.3)
-    ax2.set_xlim([0, 1])
-    ax2.set_ylim([-2.5, 2.5])
-    
-   
-    if alpha > 0.8:
-        ax2.annotate('Constructive\nInterference', xy=(0.25, 1.7), fontsize=11,
-                    bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.9),
-                    ha='center')
-        ax2.annotate('Destructive\nInterference', xy=(0.75, -0.3), fontsize=11,
-                    bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.9),
-                    ha='center')
-    
-    
-    prob_super = psi_super**2
-    ax3.plot(x, prob_super, 'purple', linewidth=3.5)
-    ax3.fill_between(x, 0, prob_super, alpha=0.5, color='purple')
-    ax3.set_ylabel('Probability |ψ(x)|²', fontsize=12)
-    ax3.set_xlabel('Position x', fontsize=12)
-    ax3.set_title('Where Will We Find The Particle?', fontsize=13, fontweight='bold')
-    ax3.grid(True, alpha=0.3)
-    ax3.set_xlim([0, 1])
-    ax3.set_ylim([0, 3.5])
-    
-    
-    if alpha > 0.8:
-        left_peak_idx = np.argmax(prob_super[:500])
-        right_peak_idx = 500 + np.argmax(prob_super[500:])
-        ax3.plot(x[left_peak_idx], prob_super[left_peak_idx], 'go', 
-                markersize=15, label=f'Left: {prob_super[left_peak_idx]:.2f}', zorder=5)
-        ax3.plot(x[right_peak_idx], prob_super[right_peak_idx], 'ro', 
-                markersize=15, label=f'Right: {prob_super[right_peak_idx]:.2f}', zorder=5)
-        ax3.legend(loc='upper right', fontsize=11)
-    
-   
-    idx_025 = 250  
-    idx_075 = 750  
-    
-    values_at_025 = [psi_1[idx_025], psi_2[idx_025] * alpha, psi_super[idx_025]]
-    values_at_075 = [psi_1[idx_075], psi_2[idx_075] * alpha, psi_super[idx_075]]
-    
-    x_pos = np.arange(3)
-    width = 0.35
-    
-    bars1 = ax4.bar(x_pos - width/2, values_at_025, width, 
-                    label='At x=0.25 (left)', color=['blue', 'red', 'purple'], alpha=0.7)
-    bars2 = ax4.bar(x_pos + width/2, values_at_075, width, 
-                    label='At x=0.75 (right)', color=['blue', 'red', 'purple'], alpha=0.4)
-    
-    ax4.axhline(y=0, color='k', linestyle='-', linewidth=1)
-    ax4.set_ylabel('Wavefunction Value', fontsize=12)
-    ax4.set_xlabel('Component', fontsize=12)
-    ax4.set_title('Comparing Left vs Right', fontsize=13, fontweight='bold')
-    ax4.set_xticks(x_pos)
-    ax4.set_xticklabels(['ψ₁', 'ψ₂', 'Sum'])
-    ax4.legend(fontsize=11)
-    ax4.grid(True, alpha=0.3, axis='y')
-    ax4.set_ylim([-1.6, 2])
-    
-   
-    if alpha > 0.8:
-        ax4.text(2, 1.5, 'LEFT:\nBoth +\n→ ADD', ha='center', fontsize=10, 
-                bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
-        ax4.text(2, -1.2, 'RIGHT:\nOpposite\n→ CANCEL', ha='center', fontsize=10,
-                bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.8))
-    
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
-    
-    
-    filename = os.path.join(output_dir, f'frame_{i:03d}.png')
-    plt.savefig(filename, dpi=100, bbox_inches='tight')
-    plt.close()
-    
\ No newline at end of file
+            weight_1 = 1.0 / np.sqrt(1 + alpha**2)
+            weight_2 = alpha / np.sqrt(1 + alpha**2)
+            np.multiply(psi_1, weight_1, out=psi_super)
+            np.multiply(psi_2, weight_2, out=self.scratch)
+            psi_super += self.scratch
+            progress = int(alpha * 100)
+            if alpha < 0.99:
+                label_text = f"Adding |n=2⟩... {progress}%"
+            else:
+                label_text = "(|n=1⟩ + |n=2⟩)/√2 ✓"
+
+        prob_super = np.square(psi_super, out=self.prob_super)
+        psi_2_scaled = np.multiply(psi_2, alpha, out=self.psi_2_scaled)
+
+        for fill in self.fills:
+            fill.remove()
+        self.fills = [
+            ax1.fill_between(x, 0, psi_2_scaled, where=mask_pos, alpha=0.2, color='red', interpolate=True),
+            ax1.fill_between(x, 0, psi_2_scaled, where=mask_neg, alpha=0.2, color='orange', interpolate=True),
+            ax2.fill_between(x, 0, psi_super, alpha=0.4, color='purple'),
+            ax3.fill_between(x, 0, prob_super, alpha=0.5, color='purple'),
+        ]
+
+
+        self.line_psi_2.set_ydata(psi_2_scaled)
+        self.legend_1.get_texts()[1].set_text(f'ψ₂ (n=2) × {alpha:.2f}')
+
+        self.line_psi_2_dashed.set_ydata(psi_2_scaled)
+        self.line_super.set_ydata(psi_super)
+        self.legend_2.get_texts()[2].set_text(label_text)
+
+        self.line_prob.set_ydata(prob_super)
+
+
+        show_notes = alpha > 0.8
+        if show_notes:
+            left_peak_idx = np.argmax(prob_super[:half])
+            right_peak_idx = half + np.argmax(prob_super[half:])
+            self.left_marker.set_data([x[left_peak_idx]], [prob_super[left_peak_idx]])
+            self.right_marker.set_data([x[right_peak_idx]], [prob_super[right_peak_idx]])
+            self.legend_3.get_texts()[0].set_text(f'Left: {prob_super[left_peak_idx]:.2f}')
+            self.legend_3.get_texts()[1].set_text(f'Right: {prob_super[right_peak_idx]:.2f}')
+        self.left_marker.set_visible(show_notes)
+        self.right_marker.set_visible(show_notes)
+        self.legend_3.set_visible(show_notes)
+        for note in self.interference_notes + self.comparison_notes:
+            note.set_visible(show_notes)
+
+
+        values_at_025 = (psi_1_025, psi_2_025 * alpha, weight_1 * psi_1_025 + weight_2 * psi_2_025)
+        values_at_075 = (psi_1_075, psi_2_075 * alpha, weight_1 * psi_1_075 + weight_2 * psi_2_075)
+
+        for bar, value in zip(self.bars1, values_at_025):
+            bar.set_height(value)
+        for bar, value in zip(self.bars2, values_at_075):
+            bar.set_height(value)
+
+
+        # Hand back the rendered pixels directly, with no PNG encode/decode round-trip
+        self.fig.canvas.draw()
+        return Image.fromarray(np.asarray(self.fig.canvas.buffer_rgba())).convert('RGB')
+
+
+# One figure per process, created on first use and reused for every later frame
+_frame_figure = None
+
+
+def render_frame(i, alpha):
+    """Draw frame i of the animation; returns it as an RGB image."""
+    global _frame_figure
+    if _frame_figure is None:
+        _frame_figure = FrameFigure()
+    return _frame_figure.render(i, alpha)
+
+
+if __name__ == "__main__":
+    print("Creating animation frames...")
+    print("="*60)
+
+    # Frames are independent, so render them on all cores. Workers read x, psi_1
+    # and psi_2 from module scope instead of receiving them with every task.
+    # map() keeps the frames in order; tqdm ticks as each one comes back.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        frames = list(tqdm(executor.map(render_frame, range(n_frames), alphas),
+                           total=n_frames, desc='frames'))
+
+    save_gif(frames, output_gif, duration=100)
+
+    file_size_mb = os.path.getsize(output_gif) / 1024 / 1024
+    print(f"\n✓ Animation saved as {output_gif} ({file_size_mb:.2f} MB)")